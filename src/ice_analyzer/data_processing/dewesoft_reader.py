@@ -1,7 +1,11 @@
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 
-__all__ = ['read_data']
+__all__ = ['read_data', 'to_datetime64']
+
+_BLOCK_SIZE = 1 << 20  # Zeichen pro Leseblock beim Zählen der Datenzeilen
+_CHUNK_ROWS = 1_000_000  # Zeilen pro read_csv-Block
 
 
 def read_data(file_path):
@@ -30,30 +34,73 @@ def read_data(file_path):
                 return metadata, corrected_time
         return metadata, None
 
-    # Datei lesen
+    # Metadaten zeilenweise lesen, bis der Datenblock "Data1" beginnt
+    metadata = []
     with open(file_path, "r") as file:
-        lines = file.readlines()
+        while True:
+            line = file.readline()
+            if not line or line.strip().startswith("Data1"):
+                break
+            metadata.append(line.strip())
 
-    metadata = []
-    data_start = False
-    time_vals, force_vals = [], []
-
-    # Dateiinhalt verarbeiten
-    for line in lines:
-        line = line.strip()
-        if line.startswith("Data1"):
-            data_start = True
-            continue
-        if not data_start:
-            metadata.append(line)
+        # Spaltenkopf ("Time ...") und Leerzeilen vor den Daten überspringen
+        while True:
+            data_offset = file.tell()
+            line = file.readline()
+            if not line or (line.strip() and not line.lstrip().startswith("Time")):
+                break
+
+        if line:
+            # Obergrenze der Datenzeilen zählen, um die Arrays einmalig anzulegen
+            file.seek(data_offset)
+            n_rows = sum(block.count("\n") for block in iter(lambda: file.read(_BLOCK_SIZE), "")) + 1
+            # (Zeit bleibt float64 wegen der Präzision, für die Kraft genügt float32)
+            time_vals = np.empty(n_rows, dtype=np.float64)
+            force_vals = np.empty(n_rows, dtype=np.float32)
+
+            # Datenblock blockweise mit dem C-Parser von pandas direkt in die Arrays schreiben
+            file.seek(data_offset)
+            chunks = pd.read_csv(
+                file, sep="\t", header=None, usecols=[0, 1],
+                dtype={0: np.float64, 1: np.float32},
+                engine="c", na_filter=False, chunksize=_CHUNK_ROWS
+            )
+            n = 0
+            for chunk in chunks:
+                k = len(chunk)
+                time_vals[n:n + k] = chunk[0].to_numpy(copy=False)
+                force_vals[n:n + k] = chunk[1].to_numpy(copy=False)
+                n += k
+            time_vals, force_vals = time_vals[:n], force_vals[:n]
         else:
-            if line and not line.startswith("Time"):
-                parts = line.split("\t")
-                time_vals.append(float(parts[0]))
-                force_vals.append(float(parts[1]))
+            time_vals, force_vals = np.empty(0, np.float64), np.empty(0, np.float32)
 
     # Startzeit korrigieren
     metadata, corrected_time = correct_start_time(metadata)
 
-    return metadata, np.array(time_vals), np.array(force_vals), corrected_time
+    return metadata, time_vals, force_vals, corrected_time
     pass
+
+
+def to_datetime64(start_time, time_vals):
+    """
+    Wandelt relative Zeitwerte (s) in absolute Zeitstempel um.
+
+    Ergebnis ist ein int64-basiertes datetime64[ns]-Array (kein object-Array aus
+    datetime-Objekten), sodass Vergleiche und Suchen vektorisiert laufen.
+
+    Args:
+        start_time (datetime): Startzeit der Messung, z.B. corrected_time aus read_data
+        time_vals (float or np.ndarray): Zeitwerte in Sekunden seit start_time
+
+    Returns:
+        np.datetime64 or np.ndarray: Zeitstempel als datetime64[ns]
+
+    Raises:
+        ValueError: Wenn start_time fehlt (None, z.B. ohne "Start time:"-Zeile)
+    """
+    if start_time is None:
+        raise ValueError("Start time is missing")
+    base = np.datetime64(start_time, 'ns')
+    offsets_ns = np.rint(np.asarray(time_vals, dtype=np.float64) * 1e9).astype(np.int64)
+    return base + offsets_ns.view('timedelta64[ns]')
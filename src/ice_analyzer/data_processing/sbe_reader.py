@@ -1,23 +1,72 @@
 import pandas as pd
 import xarray as xr
-import glob
 import numpy as np  # Wichtig für find_closest_timestamp
+import re
+import logging
 
+from ..utils.file_utils import resolve_files
+from ..utils.time_utils import nearest_index
 
-__all__ = ['read_sbe_data', 'find_closest_timestamp']
 
+logger = logging.getLogger(__name__)
 
-# Funktion prüft, ob eine Zeile mit einem gültigen Zeitstempel in eckigen Klammern beginnt
-def is_valid_datetime(line):
-    if line.startswith('['):
-        try:
-            datetime_str = line[1:24]  # Timestamp ohne öffnende Klammer
-            pd.to_datetime(datetime_str, format='%Y-%m-%d %H:%M:%S.%f')
-            return True
-        except ValueError:
-            return False
-    return False
-    pass  
+__all__ = ['read_sbe_data', 'find_closest_timestamp', 'find_closest_timestamps']
+
+# Gültige Zeile: "[YYYY-MM-DD HH:MM:SS.fff] ... # T, _, Sal, SV, ..." (mind. 5 Werte nach '#')
+_SBE_LINE_PATTERN = re.compile(
+    r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\][^#\n]*#"
+    r"([^,#\n]*),[^,#\n]*,([^,#\n]*),([^,#\n]*),[^#\n]*",
+    re.MULTILINE
+)
+
+
+def _parse_timestamps(timestamps):
+    """Wandelt 'YYYY-MM-DD HH:MM:SS.fff'-Strings vektorisiert in datetime64[ns] um."""
+    try:
+        # numpys ISO-8601-Parser (C) ist deutlich schneller als pd.to_datetime mit format
+        return np.array(timestamps, dtype='datetime64[ms]').astype('datetime64[ns]')
+    except ValueError:
+        # Ungültige Zeitstempel (z.B. Monat 13) werden zu NaT und später verworfen
+        return pd.to_datetime(pd.Series(timestamps), format='%Y-%m-%d %H:%M:%S.%f',
+                              errors='coerce', cache=True).to_numpy()
+
+
+def _to_float32(values):
+    """Wandelt Messwert-Strings in float32 um; ungültige Werte werden zu NaN."""
+    return pd.to_numeric(np.char.strip(np.asarray(values)), errors='coerce').astype(np.float32)
+
+
+def _read_sbe_file(sbe_file):
+    """
+    Liest eine SBE-Logdatei.
+
+    Returns:
+        dict[str, np.ndarray] or None: 'datetime' (datetime64[ns]) sowie 'T_deg', 'Sal', 'SV'
+            (float32) der gültigen Zeilen, oder None, wenn die Datei keine gültigen Zeilen enthält
+    """
+    logger.debug("Processing file: %s", sbe_file)
+
+    with open(sbe_file, 'r', encoding='utf8', errors='ignore') as file:
+        text = file.read()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        head = text.split('\n', 5)[:5]
+        logger.debug(f"First few lines in {sbe_file}: {head}")
+
+    # Ein Regex-Durchlauf über die ganze Datei statt Python-Schleife pro Zeile
+    matches = _SBE_LINE_PATTERN.findall(text)
+
+    if not matches:
+        logger.warning(f"No valid lines found in {sbe_file}. Skipping this file.")
+        return None
+
+    timestamps, T_deg, Sal, SV = zip(*matches)
+    return {
+        'datetime': _parse_timestamps(timestamps),
+        'T_deg': _to_float32(T_deg),
+        'Sal': _to_float32(Sal),
+        'SV': _to_float32(SV),
+    }
 
 
 def read_sbe_data(file_path_pattern):
@@ -25,70 +74,57 @@ def read_sbe_data(file_path_pattern):
     Liest und verarbeitet SBE-Logdateien in ein xarray Dataset.
 
     Args:
-        file_path_pattern (str): Dateipfad-Muster, z.B. 'SBE*'
+        file_path_pattern (str or list): Dateipfad-Muster, z.B. 'SBE*', oder Liste der Dateipfade
 
     Returns:
         ds_sbe (xarray.Dataset | None): Verarbeitetes Dataset oder None, wenn keine gültigen Daten
     """
-    rows = []
-
-    for n, sbe_file in enumerate(sorted(glob.glob(file_path_pattern))):
-        print(f"Processing file: {sbe_file}")
-
-        with open(sbe_file, 'r', encoding='utf8', errors='ignore') as file:
-            lines = [line for line in file]
-
-        print(f"First few lines in {sbe_file}:")
-        print(lines[:5])
-
-        valid_lines = [line for line in lines if is_valid_datetime(line)]
-
-        print(f"Filtered valid lines in {sbe_file}:")
-        # print(valid_lines[:5])  # Debug nur bei Bedarf aktivieren
-
-        if not valid_lines:
-            print(f"Warning: No valid lines found in {sbe_file}. Skipping this file.")
-            continue
-
-        for line in valid_lines:
-            datetime_str = line[1:24]
-            datetime_obj = pd.to_datetime(datetime_str, format='%Y-%m-%d %H:%M:%S.%f')
-
-            if '#' in line:
-                data_str = line.split('#')[1].strip()
-                data_parts = data_str.split(',')
-                if len(data_parts) >= 5:
-                    try:
-                        T_deg = float(data_parts[0].strip())
-                        SV = float(data_parts[3].strip())
-                        Sal = float(data_parts[2].strip())
-
-                        rows.append({
-                            'datetime': datetime_obj,
-                            'T_deg': T_deg,
-                            'Sal': Sal,
-                            'SV': SV
-                        })
-                    except ValueError:
-                        print(f"Warning: Invalid data format in line, skipping: {line}")
-                        continue
-
-    sbe_data = pd.DataFrame(rows)
-
-    if not sbe_data.empty:
-        ds_sbe = xr.Dataset(
-            data_vars=dict(
-                T_deg=('datetime', sbe_data['T_deg']),
-                Sal=('datetime', sbe_data['Sal']),
-                SV=('datetime', sbe_data['SV'])
-            ),
-            coords=dict(datetime=sbe_data['datetime'])
-        )
-        return ds_sbe
-    else:
-        print("No valid data was collected.")
+    parts = [_read_sbe_file(sbe_file) for sbe_file in resolve_files(file_path_pattern)]
+    parts = [part for part in parts if part is not None]
+
+    if not parts:
+        logger.warning("No valid data was collected.")
         return None
-    pass
+
+    # Typisierte Zielarrays einmal in voller Länge anlegen und dateiweise befüllen
+    n = sum(len(part['datetime']) for part in parts)
+    columns = {
+        'datetime': np.empty(n, dtype='datetime64[ns]'),
+        'T_deg': np.empty(n, dtype=np.float32),
+        'Sal': np.empty(n, dtype=np.float32),
+        'SV': np.empty(n, dtype=np.float32),
+    }
+    offset = 0
+    for part in parts:
+        stop = offset + len(part['datetime'])
+        for name, column in columns.items():
+            column[offset:stop] = part[name]
+        offset = stop
+
+    valid = ~np.isnat(columns['datetime'])
+    for name in ('T_deg', 'Sal', 'SV'):
+        valid &= ~np.isnan(columns[name])
+    if not valid.all():
+        logger.warning(f"Skipping {int(n - valid.sum())} lines with invalid data format.")
+
+    # Zeitlich sortiert, damit find_closest_timestamp binär suchen kann
+    order = np.flatnonzero(valid)
+    order = order[np.argsort(columns['datetime'][order], kind='stable')]
+    columns = {name: column[order] for name, column in columns.items()}
+
+    if not len(order):
+        logger.warning("No valid data was collected.")
+        return None
+
+    ds_sbe = xr.Dataset(
+        data_vars=dict(
+            T_deg=(('datetime',), columns['T_deg']),
+            Sal=(('datetime',), columns['Sal']),
+            SV=(('datetime',), columns['SV'])
+        ),
+        coords=dict(datetime=columns['datetime'])
+    )
+    return ds_sbe
 
 
 def find_closest_timestamp(ds_sbe, target_datetime):
@@ -106,9 +142,7 @@ def find_closest_timestamp(ds_sbe, target_datetime):
             - closest_Sal (float)
             - closest_SV (float)
     """
-    target_datetime = np.datetime64(target_datetime)
-    time_diffs = np.abs(ds_sbe['datetime'].values - target_datetime)
-    closest_idx = np.argmin(time_diffs)
+    closest_idx = nearest_index(ds_sbe['datetime'].values, target_datetime)
 
     closest_timestamp = ds_sbe['datetime'].values[closest_idx]
     closest_T_deg = ds_sbe['T_deg'].values[closest_idx]
@@ -117,3 +151,26 @@ def find_closest_timestamp(ds_sbe, target_datetime):
 
     return closest_timestamp, closest_T_deg, closest_Sal, closest_SV
     pass
+
+
+def find_closest_timestamps(ds_sbe, targets, times_i8=None):
+    """
+    Vektorisierte Variante von find_closest_timestamp für viele Zielzeitpunkte.
+
+    Args:
+        ds_sbe (xarray.Dataset): Das geladene SBE-Dataset
+        targets (array-like): Zielzeitpunkte (z.B. datetime64[ns]-Array)
+        times_i8 (np.ndarray, optional): Vorab berechnete time_index-Sicht von ds_sbe['datetime']
+
+    Returns:
+        dict[str, np.ndarray]: 'datetime', 'T_deg', 'Sal', 'SV' – je ein Wert pro Zielzeitpunkt
+    """
+    times = ds_sbe['datetime'].values if times_i8 is None else times_i8
+    closest_idx = nearest_index(times, np.atleast_1d(targets))
+
+    return {
+        'datetime': ds_sbe['datetime'].values[closest_idx],
+        'T_deg': ds_sbe['T_deg'].values[closest_idx],
+        'Sal': ds_sbe['Sal'].values[closest_idx],
+        'SV': ds_sbe['SV'].values[closest_idx],
+    }
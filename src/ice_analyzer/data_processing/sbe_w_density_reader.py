@@ -1,10 +1,79 @@
 import pandas as pd
 import xarray as xr
-import glob
 import numpy as np  
+import logging
+import warnings
+from itertools import islice
+
+from ..utils.file_utils import resolve_files
+from ..utils.time_utils import nearest_index
+
+logger = logging.getLogger(__name__)
 
 # Öffentliche Funktionen deklarieren – nur diese werden mit `from process_sbe37 import *` geladen
-__all__ = ['process_sbe37cnv_data', 'find_closest_density']
+__all__ = ['process_sbe37cnv_data', 'find_closest_density', 'find_closest_densities']
+
+_COLUMNS = [
+    'Salinity', 'Temperature', 'ElapsedTime', 'JulianTime',
+    'SoundVelocity', 'Density', 'Flag'
+]
+
+# Measured quantities are stored as float32; time columns keep float64 precision, and so does
+# Density (~1027 kg/m³ with 4 decimals needs more than float32's ~1.2e-4 spacing there)
+_DTYPES = {
+    'Salinity': np.float32, 'Temperature': np.float32, 'SoundVelocity': np.float32,
+    'Flag': np.float32,
+}
+
+
+def _read_cnv_file(file_path):
+    """Parses a single SBE37 .cnv file into a DataFrame with a 'DateTime' column."""
+    # Only the header is scanned line by line: locate '*END*' and "# start_time = ..."
+    end_index = None
+    start_time_line = None
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for i, line in enumerate(file):
+            if start_time_line is None and line.lower().startswith('# start_time'):
+                start_time_line = line
+            if '*END*' in line:
+                end_index = i
+                break
+    if end_index is None:
+        raise ValueError(f"*END* marker not found in file: {file_path}")
+
+    # Extract year from "# start_time = ..."
+    if start_time_line:
+        try:
+            time_str = start_time_line.split('=')[1].strip().split(' [')[0]
+            start_dt = pd.to_datetime(time_str)
+            year = start_dt.year
+        except Exception:
+            year = 2025  # fallback
+    else:
+        year = 2025  # fallback
+
+    # Data section after '*END*' is parsed in one pass by numpy
+    try:
+        values = np.loadtxt(file_path, skiprows=end_index + 1, usecols=range(7),
+                            dtype=np.float64, encoding='utf-8', ndmin=2)
+    except ValueError:
+        # Malformed rows (too few columns or non-numeric values) are skipped and counted once
+        with open(file_path, 'r', encoding='utf-8') as file:
+            data_lines = [line for line in islice(file, end_index + 1, None)
+                          if line.strip() and not line.lstrip().startswith('#')]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # numpy's ConversionWarning, one per dropped row
+            values = np.genfromtxt(data_lines, usecols=range(7), dtype=np.float64, invalid_raise=False)
+        values = values.reshape(-1, len(_COLUMNS))
+        values = values[~np.isnan(values).any(axis=1)]
+        logger.warning(f"Skipping {len(data_lines) - len(values)} malformed rows in {file_path}.")
+
+    df_file = pd.DataFrame(values, columns=_COLUMNS).astype(_DTYPES)
+
+    # Convert Julian day-of-year to datetime
+    julian_base_time = pd.to_datetime(f"{year}-01-01 00:00:00", format='%Y-%m-%d %H:%M:%S')
+    df_file['DateTime'] = julian_base_time + pd.to_timedelta(df_file['JulianTime'] - 1, unit='D')
+    return df_file
 
 
 def process_sbe37cnv_data(file_path_pattern):
@@ -12,74 +81,39 @@ def process_sbe37cnv_data(file_path_pattern):
     Processes SBE37 .cnv data files and returns an xarray Dataset.
 
     Args:
-        file_path_pattern (str): The file path pattern to match the SBE37 .cnv files
-            (e.g., 'data/sbe37sm-rs232_03707247_*.cnv').
+        file_path_pattern (str or list): The file path pattern to match the SBE37 .cnv files
+            (e.g., 'data/sbe37sm-rs232_03707247_*.cnv'), or a list of file paths.
 
     Returns:
         ds_sbe_pro (xarray.Dataset): The processed dataset with Salinity, Temperature,
             and other variables, including correct datetime coordinates.
     """
-    file_paths = sorted(glob.glob(file_path_pattern))
+    file_paths = resolve_files(file_path_pattern)
     if not file_paths:
         raise FileNotFoundError(f"No files found matching the pattern: {file_path_pattern}")
 
-    data = []
-    for file_path in file_paths:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-
-        # Find data section after '*END*'
-        end_index = next((i for i, line in enumerate(lines) if '*END*' in line), None)
-        if end_index is None:
-            raise ValueError(f"*END* marker not found in file: {file_path}")
-        data_lines = lines[end_index + 1:]
-
-        # Extract year from "# start_time = ..."
-        start_time_line = next((line for line in lines if line.lower().startswith('# start_time')), None)
-        if start_time_line:
-            try:
-                time_str = start_time_line.split('=')[1].strip().split(' [')[0]
-                start_dt = pd.to_datetime(time_str)
-                year = start_dt.year
-            except Exception:
-                year = 2025  # fallback
-        else:
-            year = 2025  # fallback
+    frames = [_read_cnv_file(file_path) for file_path in file_paths]
 
-        for line in data_lines:
-            parts = line.split()
-            if len(parts) >= 7:
-                try:
-                    row = [float(part) for part in parts[:7]]
-                    data.append(row)
-                except ValueError:
-                    continue
+    # Sorted in time so that find_closest_density can use a binary search
+    df = pd.concat(frames, ignore_index=True).sort_values('DateTime', kind='stable')
 
-    df = pd.DataFrame(data, columns=[
-        'Salinity', 'Temperature', 'ElapsedTime', 'JulianTime',
-        'SoundVelocity', 'Density', 'Flag'
-    ])
-
-    # Convert Julian day-of-year to datetime
-    julian_base_time = pd.to_datetime(f"{year}-01-01 00:00:00")
-    df['DateTime'] = julian_base_time + pd.to_timedelta(df['JulianTime'] - 1, unit='D')
-
-    # Convert to xarray Dataset
+    # Convert to xarray Dataset; numpy arrays (not Series) are wrapped by xarray without a copy
     ds_sbe_pro = xr.Dataset(
         data_vars={
-            'Salinity': ('datetime', df['Salinity']),
-            'Temperature': ('datetime', df['Temperature']),
-            'ElapsedTime': ('datetime', df['ElapsedTime']),
-            'SoundVelocity': ('datetime', df['SoundVelocity']),
-            'Density': ('datetime', df['Density']),
-            'Flag': ('datetime', df['Flag']),
+            'Salinity': (('datetime',), df['Salinity'].to_numpy(copy=False)),
+            'Temperature': (('datetime',), df['Temperature'].to_numpy(copy=False)),
+            'ElapsedTime': (('datetime',), df['ElapsedTime'].to_numpy(copy=False)),
+            'SoundVelocity': (('datetime',), df['SoundVelocity'].to_numpy(copy=False)),
+            'Density': (('datetime',), df['Density'].to_numpy(copy=False)),
+            'Flag': (('datetime',), df['Flag'].to_numpy(copy=False)),
         },
         coords={
-            'datetime': df['DateTime']
+            'datetime': df['DateTime'].to_numpy(copy=False)
         }
     )
 
-    print("Letzter Zeitstempel:", pd.to_datetime(ds_sbe_pro['datetime'].values[-1]))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Letzter Zeitstempel: %s", pd.to_datetime(ds_sbe_pro['datetime'].values[-1]))
 
     return ds_sbe_pro
     pass
@@ -96,9 +130,7 @@ def find_closest_density(ds_sbe, target_datetime):
     Returns:
         tuple: (datetime64, Temperature, Salinity, SoundVelocity, Density)
     """
-    target_datetime = np.datetime64(target_datetime)
-    time_diffs = np.abs(ds_sbe['datetime'].values - target_datetime)
-    closest_idx = np.argmin(time_diffs)
+    closest_idx = nearest_index(ds_sbe['datetime'].values, target_datetime)
 
     closest_timestamp2 = ds_sbe['datetime'].values[closest_idx]
     closest_T_deg2 = ds_sbe['Temperature'].values[closest_idx]
@@ -108,3 +140,28 @@ def find_closest_density(ds_sbe, target_datetime):
 
     return closest_timestamp2, closest_T_deg2, closest_Sal2, closest_SV2, closest_Density
     pass
+
+
+def find_closest_densities(ds_sbe, targets, times_i8=None):
+    """
+    Vectorized version of find_closest_density for an array of target times.
+
+    Args:
+        ds_sbe (xarray.Dataset): Der verarbeitete Datensatz mit Zeitreihe
+        targets (array-like): Die Zielzeitpunkte (e.g. datetime64[ns] array)
+        times_i8 (np.ndarray, optional): Precomputed time_index view of ds_sbe['datetime']
+
+    Returns:
+        dict[str, np.ndarray]: 'datetime', 'Temperature', 'Salinity', 'SoundVelocity',
+            'Density' – one value per target
+    """
+    times = ds_sbe['datetime'].values if times_i8 is None else times_i8
+    closest_idx = nearest_index(times, np.atleast_1d(targets))
+
+    return {
+        'datetime': ds_sbe['datetime'].values[closest_idx],
+        'Temperature': ds_sbe['Temperature'].values[closest_idx],
+        'Salinity': ds_sbe['Salinity'].values[closest_idx],
+        'SoundVelocity': ds_sbe['SoundVelocity'].values[closest_idx],
+        'Density': ds_sbe['Density'].values[closest_idx],
+    }
@@ -1,11 +1,82 @@
 import numpy as np
 import pandas as pd
 import xarray as xr
-import glob
+import logging
+import io
+import mmap
 import re
 
-# Nur diese beiden Funktionen sind Teil des öffentlichen API
-__all__ = ['read_tstick_data', 'find_closest_tstick']
+from ..utils.file_utils import resolve_files
+from ..utils.time_utils import nearest_index
+
+logger = logging.getLogger(__name__)
+
+# Nur diese Funktionen sind Teil des öffentlichen API
+__all__ = ['read_tstick_data', 'find_closest_tstick', 'find_closest_tsticks']
+
+# Spalten einer Logzeile: "[Datum Uhrzeit] ISO-Zeitstempel T0 ... T15"
+_T_COLUMNS = [f'T{i}' for i in range(16)]
+_COLUMNS = ['date', 'time', 'iso'] + _T_COLUMNS
+_DTYPES = dict.fromkeys(_T_COLUMNS, np.float32)
+
+# Sensorhöhen der 16 Thermistoren (m), einmalig angelegt und schreibgeschützt geteilt
+_Z_COORD = np.arange(16) * 0.02 - 0.07
+_Z_COORD.flags.writeable = False
+
+# Regex: Zeilen mit gültigem Format (Zeitstempel + 16 Float-Werte)
+_TSTICK_LINE_PATTERN = re.compile(
+    rb"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}\][ \t]"
+    rb"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
+    rb"(?:[ \t]+-?\d+\.\d+){16}[ \t]*\r?$",
+    re.MULTILINE
+)
+
+_COUNT_BLOCK = 1 << 20  # Zeilen werden blockweise (1 MiB) gezählt, ohne die ganze Datei zu kopieren
+
+
+def _read_tstick_file(T_file):
+    """
+    Liest eine T-Stick-Logdatei ein.
+
+    Returns:
+        tuple: (DataFrame mit gültigen Zeilen, Anzahl gelesener Zeilen) oder None bei Lesefehler
+    """
+    logger.debug("Processing file: %s", T_file)
+
+    try:
+        # Datei per mmap einbinden: der Regex läuft in einem C-Durchlauf über den ganzen Puffer
+        with open(T_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            valid_lines = _TSTICK_LINE_PATTERN.findall(mm)
+            file_total = sum(mm[start:start + _COUNT_BLOCK].count(b"\n")
+                             for start in range(0, len(mm), _COUNT_BLOCK))
+            if mm[-1:] != b"\n":
+                file_total += 1  # letzte Zeile ohne Zeilenumbruch
+    except ValueError:
+        # Leere Datei (mmap mit Länge 0 nicht möglich)
+        valid_lines, file_total = [], 0
+    except Exception as e:
+        logger.error(f"Error reading file {T_file}: {e}")
+        return None
+
+    if not valid_lines:
+        logger.debug("File %s: 0/%d lines kept (%d skipped)", T_file, file_total, file_total)
+        return pd.DataFrame(columns=['datetime'] + _T_COLUMNS), file_total
+
+    # Alle gültigen Zeilen haben dieselbe Spaltenzahl: ein typisierter C-Parser-Durchlauf genügt
+    frame = pd.read_csv(io.BytesIO(b"\n".join(valid_lines)), sep=r'\s+', header=None,
+                        names=_COLUMNS, dtype=_DTYPES, engine='c')
+
+    # Klammern stehen an fester Position: "[YYYY-MM-DD" und "HH:MM:SS.fff]"
+    frame['datetime'] = pd.to_datetime(
+        frame['date'].str.slice(1) + ' ' + frame['time'].str.slice(stop=-1),
+        format='%Y-%m-%d %H:%M:%S.%f', errors='coerce', cache=True
+    )
+    frame = frame.loc[frame['datetime'].notna(), ['datetime'] + _T_COLUMNS]
+
+    file_valid = len(frame)
+    logger.debug("File %s: %d/%d lines kept (%d skipped)", T_file, file_valid, file_total, file_total - file_valid)
+
+    return frame, file_total
 
 
 def read_tstick_data(file_path_pattern, downsample_rate=10):
@@ -14,86 +85,44 @@ def read_tstick_data(file_path_pattern, downsample_rate=10):
     and returns an xarray dataset.
 
     Args:
-        file_path_pattern (str): The glob pattern for T-stick log files (e.g., 'T_Stick*.log')
+        file_path_pattern (str or list): The glob pattern for T-stick log files (e.g., 'T_Stick*.log'),
+            or a list of file paths
         downsample_rate (int): The rate at which to downsample the data (default is 10)
 
     Returns:
         ds_tsticks (xarray.Dataset): The processed xarray dataset with 'datetime' coordinate
     """
-    files = sorted(glob.glob(file_path_pattern))
-    valid_data = []
-    total_lines_count = 0
-    skipped_lines_count = 0
-
-    # Regex: Zeilen mit gültigem Format (Zeitstempel + 16 Float-Werte)
-    pattern = re.compile(
-        r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}\]\s"
-        r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\s"
-        r"(-?\d+\.\d+\s){16}"
-    )
-
-    for T_file in files:
-        print(f"Processing file: {T_file}")
+    files = resolve_files(file_path_pattern)
 
-        file_total = 0
-        file_valid = 0
+    results = [result for result in map(_read_tstick_file, files) if result is not None]
+    frames = [frame for frame, _ in results if not frame.empty]
+    total_lines_count = sum(file_total for _, file_total in results)
+    skipped_lines_count = total_lines_count - sum(len(frame) for frame in frames)
 
-        try:
-            with open(T_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    file_total += 1
-                    if pattern.match(line):
-                        valid_data.append(line.strip())
-                        file_valid += 1
-                    else:
-                        print(f"Skipping malformed line in {T_file}: {line.strip()}")
-        except Exception as e:
-            print(f"Error reading file {T_file}: {e}")
-            continue
-
-        file_skipped = file_total - file_valid
-        total_lines_count += file_total
-        skipped_lines_count += file_skipped
-
-        print(f"File {T_file}: {file_valid}/{file_total} lines kept ({file_skipped} skipped)")
-
-    if not valid_data:
+    data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if data.empty:
         raise ValueError("No valid data was read from the files.")
 
-    # Verarbeitung zu DataFrame
-    data = pd.DataFrame([line.split() for line in valid_data])
-    data.iloc[:, 0] = data.iloc[:, 0].str.strip('[')
-    data.iloc[:, 1] = data.iloc[:, 1].str.strip(']')
-    data['datetime'] = data.iloc[:, 0] + ' ' + data.iloc[:, 1]
-    data = data.drop(columns=[0, 1, 2])
-    data['datetime'] = pd.to_datetime(data['datetime'], format='%Y-%m-%d %H:%M:%S.%f', errors='coerce')
-    data = data[~data['datetime'].duplicated(keep=False)]
-    data = data.sort_values(by='datetime', ascending=True)
+    # Sortieren und doppelte Zeitstempel (erster Eintrag bleibt) in einem Schritt
+    data = data.sort_values(by='datetime', kind='stable').drop_duplicates('datetime', keep='first')
 
-    T_columns = [col for col in data.columns if col != 'datetime']
-    data = data[['datetime'] + T_columns]
-    data[T_columns] = data[T_columns].apply(pd.to_numeric, errors='coerce')
+    logger.debug("%s", data.head(1))  # Optionales Preview (nur formatiert, wenn DEBUG aktiv)
 
-    print(data.head(1))  # Optionales Preview
-
-    # xarray Dataset erzeugen
+    # xarray Dataset erzeugen; numpy-Arrays werden von xarray ohne weitere Kopie übernommen
     ds_tsticks = xr.Dataset(
         data_vars=dict(
-            T_deg=(('z', 'datetime'), data[T_columns].T.values),
+            T_deg=(('z', 'datetime'), data[_T_COLUMNS].to_numpy(dtype=np.float32).T),
         ),
         coords=dict(
-            datetime=data['datetime'].values,
-            z=np.arange(16) * 0.02 - 0.07
+            datetime=data['datetime'].to_numpy(copy=False),
+            z=_Z_COORD
         )
     )
 
-    print(ds_tsticks)
-    print(ds_tsticks.dims)
-
-    ds_tsticks = ds_tsticks.drop_duplicates(dim='datetime', keep='first')
+    logger.debug("%s", ds_tsticks)
 
-    print(f"\nSummary: {total_lines_count - skipped_lines_count}/{total_lines_count} lines kept "
-          f"({skipped_lines_count} skipped across all files)")
+    logger.info(f"T-Stick summary: {total_lines_count - skipped_lines_count}/{total_lines_count} lines kept "
+                f"({skipped_lines_count} skipped across all files)")
 
     return ds_tsticks
     pass
@@ -116,12 +145,36 @@ def find_closest_tstick(ds_tsticks, target_datetime):
     if ds_tsticks is None:
         return None, None
 
-    target_datetime = np.datetime64(target_datetime)
-    time_diffs = np.abs(ds_tsticks['datetime'].values - target_datetime)
-    closest_idx = np.argmin(time_diffs)
+    closest_idx = nearest_index(ds_tsticks['datetime'].values, target_datetime)
 
     closest_timestamp = ds_tsticks['datetime'].values[closest_idx]
     closest_Tstick_Temp = ds_tsticks['T_deg'].isel(datetime=closest_idx)
 
     return closest_timestamp, closest_Tstick_Temp
     pass
+
+
+def find_closest_tsticks(ds_tsticks, targets, times_i8=None):
+    """
+    Vektorisierte Variante von find_closest_tstick für viele Zielzeitpunkte.
+
+    Args:
+        ds_tsticks (xarray.Dataset): Das T-stick Dataset
+        targets (array-like): Die Zielzeitpunkte (z.B. datetime64[ns]-Array)
+        times_i8 (np.ndarray, optional): Vorab berechnete time_index-Sicht von ds_tsticks['datetime']
+
+    Returns:
+        dict[str, np.ndarray] or None:
+            - 'datetime': nächstgelegene Zeitstempel, Form (M,)
+            - 'T_deg': Temperaturprofile, Form (M, z)
+    """
+    if ds_tsticks is None:
+        return None
+
+    times = ds_tsticks['datetime'].values if times_i8 is None else times_i8
+    closest_idx = nearest_index(times, np.atleast_1d(targets))
+
+    return {
+        'datetime': ds_tsticks['datetime'].values[closest_idx],
+        'T_deg': ds_tsticks['T_deg'].values[:, closest_idx].T,  # T_deg hat die Dimensionen (z, datetime)
+    }
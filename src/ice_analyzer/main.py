@@ -10,21 +10,20 @@ Date: 2025
 """
 
 import os
-import glob
 import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, List, Tuple, Dict, Any
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
+from datetime import datetime
 
-from .utils.file_utils import *
-from .visualization.plots import *
-from .data_processing.dewesoft_reader import read_data
-from .data_processing.sbe_reader import *
-from .data_processing.sbe_w_density_reader import *
-from .data_processing.tstick_reader import *
+from .data_processing.dewesoft_reader import read_data, to_datetime64
+from .data_processing.sbe_reader import read_sbe_data, find_closest_timestamps
+from .data_processing.sbe_w_density_reader import process_sbe37cnv_data, find_closest_densities
+from .data_processing.tstick_reader import read_tstick_data, find_closest_tsticks
+from .utils.time_utils import time_index
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +32,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Timestamp columns of the summaries; stored as datetime64[ns] in the master store
+_TIME_COLUMNS = ["Experiment_PeakTime", "ctd_time", "tstick_time"]
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S."  # Format of the timestamps in the CSV files
+_MEASUREMENT_COLUMNS = ["ctd_T", "ctd_S", "ctd_SV"]  # float32, as returned by the readers
+# Compact dtypes of the master summary: float32 measurements, repeated names as categories;
+# the density keeps float64 (4 decimals at ~1027 kg/m³ are below float32 resolution)
+_MASTER_DTYPES = {
+    **{col: np.float32 for col in _MEASUREMENT_COLUMNS},
+    "ctd_rho": np.float64,
+    "experiment_folder": "category",
+    "measurement_file_[.txt]": "category",
+}
+# Text columns and the value written for missing entries (empty CSV fields are read back as NaN)
+_TEXT_DEFAULTS = {"tstick_profile": "N/A", "caution": ""}
+_TEST_FILE_PREFIXES = ("Test02_", "BiegeF_", "Emodul_")  # Test files: <prefix>*.txt
+_ENV_CACHE_SIZE = 6  # Environmental datasets kept in memory (3 readers x 2 folders)
+
 
 class IceExperimentAnalyzer:
     """
@@ -52,7 +68,12 @@ class IceExperimentAnalyzer:
         """
         self.base_experiment_path = Path(base_experiment_path)
         self.reference_time = reference_time or datetime(2025, 7, 28, 0, 0, 0)  # Default reference
-        self.master_csv_path = self.base_experiment_path / "ALL_EXPERIMENTS_SUMMARY.csv"
+        self.master_store_path = self.base_experiment_path / "_master_parts"  # One Parquet part per processed folder
+        self.master_parquet_path = self.base_experiment_path / "ALL_EXPERIMENTS_SUMMARY.parquet"  # Legacy store
+        self.master_csv_path = self.base_experiment_path / "ALL_EXPERIMENTS_SUMMARY.csv"  # Legacy store / CSV export
+        self._existing_df: Optional[pd.DataFrame] = None  # Cached master summary, see _load_master
+        self._env_cache: Dict[Tuple, Any] = OrderedDict()  # LRU of environmental datasets, see _read_environmental
+        self.info_text_by_file: Dict[str, str] = {}  # Info file headers for plotting, by absolute test file path
         
         # DataFrame columns definition
         self.df_columns = [
@@ -81,29 +102,116 @@ class IceExperimentAnalyzer:
         
         folders = [
             f.name for f in self.base_experiment_path.iterdir()
-            if f.is_dir() and not f.name.startswith('.')
+            if f.is_dir() and not f.name.startswith('.') and f != self.master_store_path
         ]
         
         logger.info(f"Found {len(folders)} experiment folders: {folders}")
         return folders
     
+    @staticmethod
+    def _as_master_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Bring a summary to the dtypes of the master store.
+        
+        Timestamp columns (CSV strings, 'N/A' for missing) become datetime64[ns] and
+        text columns strings, so that all Parquet parts share one schema; see also
+        _MASTER_DTYPES and _TEXT_DEFAULTS.
+        """
+        for col in _TIME_COLUMNS:
+            if col in df.columns:
+                if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                    df[col] = pd.to_datetime(df[col], format=_TIMESTAMP_FORMAT, errors='coerce')
+                df[col] = df[col].astype('datetime64[ns]')
+        for col, default in _TEXT_DEFAULTS.items():
+            if col in df.columns:
+                df[col] = df[col].astype(object).fillna(default).astype(str)
+        return df.astype({col: dtype for col, dtype in _MASTER_DTYPES.items() if col in df.columns})
+    
+    def _master_parts(self) -> List[Path]:
+        """Parquet parts of the master summary, oldest first (by modification time)."""
+        if not self.master_store_path.is_dir():
+            return []
+        parts = self.master_store_path.glob("part_*.parquet")
+        return sorted(parts, key=lambda path: (path.stat().st_mtime_ns, path.name))
+    
+    def _append_master_part(self, name: str, df: pd.DataFrame) -> Path:
+        """Write a summary as a new Parquet part of the master summary."""
+        self.master_store_path.mkdir(exist_ok=True)
+        part_path = self.master_store_path / f"part_{name}_{datetime.now():%Y%m%dT%H%M%S%f}.parquet"
+        self._as_master_dtypes(df).to_parquet(part_path, engine='pyarrow', compression='zstd', index=False)
+        return part_path
+    
+    def load_master(self) -> pd.DataFrame:
+        """
+        Load the master summary from its Parquet parts.
+        
+        Falls back to the legacy single-file stores (ALL_EXPERIMENTS_SUMMARY.parquet,
+        then ALL_EXPERIMENTS_SUMMARY.csv); they are migrated into a part with the next run.
+        
+        Returns:
+            DataFrame with all previously saved measurements (empty if none)
+        """
+        parts = self._master_parts()
+        if parts:
+            return pd.read_parquet(parts, engine='pyarrow')
+        if self.master_parquet_path.exists():
+            return pd.read_parquet(self.master_parquet_path, engine='pyarrow')
+        if self.master_csv_path.exists():
+            logger.info(f"Migrating legacy master CSV: {self.master_csv_path}")
+            return self._as_master_dtypes(pd.read_csv(self.master_csv_path, sep=';', decimal=','))
+        return pd.DataFrame()
+    
+    def _load_master(self) -> pd.DataFrame:
+        """Cached load_master: the store is only read on first use."""
+        if self._existing_df is None:
+            self._existing_df = self.load_master()
+        return self._existing_df
+    
+    def _load_folder_column(self) -> pd.Series:
+        """
+        Load only the experiment_folder column of the master summary.
+        
+        From the Parquet parts just this column is read; the legacy stores are loaded in full.
+        """
+        parts = self._master_parts()
+        if parts:
+            return pd.read_parquet(parts, engine='pyarrow', columns=['experiment_folder'])['experiment_folder']
+        existing_df = self._load_master()
+        if 'experiment_folder' in existing_df.columns:
+            return existing_df['experiment_folder']
+        return pd.Series(dtype=object, name='experiment_folder')
+    
+    def export_master_csv(self, csv_path: Optional[Path] = None) -> Path:
+        """
+        Export the master summary as CSV for external tools.
+        
+        Args:
+            csv_path: Output file (default: ALL_EXPERIMENTS_SUMMARY.csv in the base directory)
+            
+        Returns:
+            Path of the written CSV file
+        """
+        csv_path = Path(csv_path) if csv_path is not None else self.master_csv_path
+        self._load_master().to_csv(csv_path, index=False, sep=';', decimal=',', date_format=_TIMESTAMP_FORMAT)
+        logger.info(f"Master summary exported: {csv_path}")
+        return csv_path
+    
     def get_processed_folders(self) -> set:
         """
-        Get set of already processed folders from master CSV.
+        Get set of already processed folders from the master summary.
         
         Returns:
             Set of processed folder names
         """
         processed_folders = set()
         
-        if self.master_csv_path.exists():
-            try:
-                existing_df = pd.read_csv(self.master_csv_path, sep=';', decimal=',')
-                if 'experiment_folder' in existing_df.columns:
-                    processed_folders = set(existing_df['experiment_folder'].unique())
-                    logger.info(f"Already processed folders: {sorted(processed_folders)}")
-            except Exception as e:
-                logger.warning(f"Error loading existing CSV: {e}")
+        try:
+            folder_column = self._load_folder_column()
+            if not folder_column.empty:
+                processed_folders = set(folder_column.unique())
+                logger.info(f"Already processed folders: {sorted(processed_folders)}")
+        except Exception as e:
+            logger.warning(f"Error loading existing master summary: {e}")
         
         return processed_folders
     
@@ -120,30 +228,52 @@ class IceExperimentAnalyzer:
         logger.info(f"Processing folder: {folder_path}")
         
         try:
+            # List the folder once for environmental and test files
+            folder_files = self._scan_folder(folder_path)
+            
             # Load environmental data
-            env_data = self._load_environmental_data(folder_path)
+            env_data = self._load_environmental_data(folder_path, folder_files)
             if not env_data:
                 logger.warning(f"No environmental data found in {folder_path}")
                 return None
             
             # Find test files
-            test_files = self._find_test_files(folder_path)
+            test_files = self._find_test_files(folder_path, folder_files)
             if not test_files:
                 logger.warning(f"No test files found in {folder_path}")
                 return None
             
             logger.info(f"Found {len(test_files)} test files")
             
-            # Process each test file
-            df_rows = []
-            for test_file in test_files:
-                row_data = self._process_test_file(test_file, env_data)
-                if row_data:
-                    row_data["experiment_folder"] = folder_path.name
-                    df_rows.append(row_data)
+            # Peak-force timestamp of each test file, written into a preallocated column
+            n = len(test_files)
+            peak_times = np.empty(n, dtype='datetime64[ns]')
+            found = np.zeros(n, dtype=bool)
+            for i, test_file in enumerate(test_files):
+                max_timestamp = self._find_peak_time(test_file)
+                if max_timestamp is not None:
+                    peak_times[i] = max_timestamp
+                    found[i] = True
+            test_files = [test_file for test_file, ok in zip(test_files, found) if ok]
+            peak_times = peak_times[found]
+            
+            # Closest environmental measurements for all test files in one batched lookup
+            closest = self._find_closest_measurements(peak_times, env_data)
+            
+            # Create info file of each test file
+            kept = np.zeros(len(test_files), dtype=bool)
+            for i, test_file in enumerate(test_files):
+                try:
+                    closest_data = {key: values[i] for key, values in closest.items()}
+                    self.info_text_by_file[os.path.abspath(test_file)] = self._create_info_file(
+                        test_file, pd.Timestamp(peak_times[i]), closest_data
+                    )
+                    kept[i] = True
+                except Exception as e:
+                    logger.error(f"Error processing test file {test_file}: {e}")
             
-            if df_rows:
-                df_result = pd.DataFrame(df_rows)
+            if kept.any():
+                df_result = self._build_summary(folder_path.name, test_files, peak_times, closest, kept)
                 self._save_folder_summary(folder_path, df_result)
                 return df_result
             
@@ -151,167 +281,244 @@ class IceExperimentAnalyzer:
             logger.error(f"Error processing {folder_path}: {str(e)}")
             return None
     
-    def _load_environmental_data(self, folder_path: Path) -> Dict[str, Any]:
+    def _scan_folder(self, folder_path: Path) -> Dict[str, List[Path]]:
+        """
+        Classify the files of an experiment folder in a single directory listing.
+        
+        Returns:
+            Sorted file lists for 'test' (Test02_/BiegeF_/Emodul_*.txt), 'sbe' (SBE*.log),
+            'tstick' (T_Stick_2025*.log) and 'density' (*.cnv)
+        """
+        folder_files = {'test': [], 'sbe': [], 'tstick': [], 'density': []}
+        
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or not entry.is_file():
+                    continue
+                if name.startswith(_TEST_FILE_PREFIXES) and name.endswith('.txt'):
+                    folder_files['test'].append(Path(entry.path))
+                elif name.startswith('SBE') and name.endswith('.log'):
+                    folder_files['sbe'].append(Path(entry.path))
+                elif name.startswith('T_Stick_2025') and name.endswith('.log'):
+                    folder_files['tstick'].append(Path(entry.path))
+                elif name.endswith('.cnv'):
+                    folder_files['density'].append(Path(entry.path))
+        
+        return {kind: sorted(paths) for kind, paths in folder_files.items()}
+    
+    def _read_environmental(self, reader, files: List[Path], **kwargs) -> Any:
+        """
+        Run an environmental data reader on the given files, reusing its result while they are unchanged.
+        
+        The cache key holds the resolved path and modification time of every file,
+        so a log file shared by several folders is read once.
+        Only the _ENV_CACHE_SIZE most recently used datasets are kept.
+        """
+        key = (
+            reader.__name__,
+            tuple((os.path.realpath(path), os.stat(path).st_mtime_ns) for path in files),
+            tuple(sorted(kwargs.items())),
+        )
+        if key in self._env_cache:
+            self._env_cache.move_to_end(key)
+            return self._env_cache[key]
+        
+        result = reader(files, **kwargs)
+        self._env_cache[key] = result
+        while len(self._env_cache) > _ENV_CACHE_SIZE:
+            self._env_cache.popitem(last=False)
+        return result
+    
+    def _load_environmental_data(self, folder_path: Path,
+                                 folder_files: Optional[Dict[str, List[Path]]] = None) -> Dict[str, Any]:
         """Load all environmental data for a folder."""
         env_data = {}
         
         try:
-            # Load SBE data
-            sbe_pattern = str(folder_path / "SBE*.log")
-            env_data['ds_sbe'] = read_sbe_data(sbe_pattern)  # Your existing function
+            if folder_files is None:
+                folder_files = self._scan_folder(folder_path)
+            
+            # Load SBE data (SBE*.log)
+            env_data['ds_sbe'] = self._read_environmental(  # Your existing function
+                read_sbe_data, folder_files['sbe']
+            )
             
-            # Load T-Stick data
-            tstick_pattern = str(folder_path / "T_Stick_2025*.log")
+            # Load T-Stick data (T_Stick_2025*.log)
             try:
-                env_data['ds_tsticks'] = read_tstick_data(tstick_pattern, downsample_rate=10)
+                env_data['ds_tsticks'] = self._read_environmental(
+                    read_tstick_data, folder_files['tstick'], downsample_rate=10
+                )
             except ValueError:
                 env_data['ds_tsticks'] = None
             
-            # Load density data
-            density_pattern = str(folder_path / "*.cnv")
+            # Load density data (*.cnv)
             try:
-                env_data['ds_density'] = process_sbe37cnv_data(density_pattern)
+                env_data['ds_density'] = self._read_environmental(
+                    process_sbe37cnv_data, folder_files['density']
+                )
             except (FileNotFoundError, ValueError):
                 env_data['ds_density'] = None
             
+            # Int64 time axes once per folder, reused by every closest-measurement lookup
+            for name in ('sbe', 'tsticks', 'density'):
+                ds = env_data[f'ds_{name}']
+                env_data[f'{name}_time_i8'] = time_index(ds['datetime'].values) if ds is not None else None
+            
             return env_data
             
         except Exception as e:
             logger.error(f"Error loading environmental data: {e}")
             return {}
     
-    def _find_test_files(self, folder_path: Path) -> List[Path]:
+    def _find_test_files(self, folder_path: Path,
+                         folder_files: Optional[Dict[str, List[Path]]] = None) -> List[Path]:
         """Find all test files in a folder."""
-        patterns = ["Test02_*.txt", "BiegeF_*.txt", "Emodul_*.txt"]
-        test_files = []
-        
-        for pattern in patterns:
-            files = list(folder_path.glob(pattern))
-            test_files.extend(files)
-        
-        return sorted(test_files)
+        if folder_files is None:
+            folder_files = self._scan_folder(folder_path)
+        return folder_files['test']
     
-    def _process_test_file(self, test_file: Path, env_data: Dict) -> Optional[Dict]:
-        """Process a single test file and extract relevant data."""
+    def _find_peak_time(self, test_file: Path) -> Optional[np.datetime64]:
+        """Read a test file and return the timestamp of its maximum force."""
         try:
             # Read test data (your existing function)
             meta, time_data, force_data, corrected_time = read_data(str(test_file))
             #meta, corrected_time = correct_start_time(meta) #(old line)
             
-            # Convert to datetime
-            time_data_dt = np.array([
-                corrected_time + timedelta(seconds=t) for t in time_data
-            ])
-            
-            # Find maximum force timestamp
-            max_idx = np.argmax(force_data)
-            max_timestamp = time_data_dt[max_idx]
-            
-            # Find closest measurements
-            closest_data = self._find_closest_measurements(max_timestamp, env_data)
-            
-            # Create info file
-            self._create_info_file(test_file, max_timestamp, closest_data)
-            
-            # Prepare row data for DataFrame
-            row_data = {
-                "measurement_file_[.txt]": test_file.name,
-                "Experiment_PeakTime": pd.Timestamp(max_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-6],
-                "ctd_time": closest_data.get('ctd_time', 'N/A'),
-                "ctd_T": closest_data.get('ctd_T', np.nan),
-                "ctd_S": closest_data.get('ctd_S', np.nan),
-                "ctd_SV": closest_data.get('ctd_SV', np.nan),
-                "ctd_rho": closest_data.get('ctd_rho', np.nan),
-                "tstick_time": closest_data.get('tstick_time', 'N/A'),
-                "tstick_profile": closest_data.get('tstick_profile', 'N/A'),
-                "caution": ""
-            }
-            
-            return row_data
+            # Find maximum force timestamp (only this one sample is converted to datetime)
+            if corrected_time is None:
+                logger.error(f"No start time found in test file {test_file}")
+                return None
+            max_idx = int(np.argmax(force_data))
+            max_timestamp = to_datetime64(corrected_time, time_data[max_idx])
+            if np.isnat(max_timestamp):
+                logger.error(f"Invalid peak timestamp in test file {test_file}")
+                return None
+            return max_timestamp
             
         except Exception as e:
             logger.error(f"Error processing test file {test_file}: {e}")
             return None
     
-    def _find_closest_measurements(self, timestamp: datetime, env_data: Dict) -> Dict:
-        """Find closest environmental measurements to given timestamp."""
+    def _find_closest_measurements(self, timestamps: np.ndarray, env_data: Dict) -> Dict[str, np.ndarray]:
+        """
+        Find closest environmental measurements to the given timestamps.
+        
+        All timestamps are looked up at once (binary search over the sorted
+        environmental time axes). Returns one column per measurement with one
+        entry per timestamp; columns of missing datasets are left out.
+        """
         closest_data = {}
         
         # Find closest CTD data (your existing functions)
-        if env_data.get('ds_sbe'):
-            sbe_timestamp, sbe_T, sbe_S, sbe_SV = find_closest_timestamp(
-                env_data['ds_sbe'], timestamp
-            )
+        if env_data.get('ds_sbe') is not None:
+            sbe = find_closest_timestamps(env_data['ds_sbe'], timestamps, env_data.get('sbe_time_i8'))
             closest_data.update({
-                'sbe_time': pd.Timestamp(sbe_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-6],
-                'sbe_T': sbe_T,
-                'sbe_S': sbe_S,
-                'sbe_SV': sbe_SV
+                'sbe_time': sbe['datetime'],
+                'sbe_T': sbe['T_deg'],
+                'sbe_S': sbe['Sal'],
+                'sbe_SV': sbe['SV']
             })
         
-        if env_data.get('ds_density'):
-            density_timestamp, density_T, density_S, density_SV, density_rho = find_closest_density(
-                env_data['ds_density'], timestamp
-            )
+        if env_data.get('ds_density') is not None:
+            density = find_closest_densities(env_data['ds_density'], timestamps, env_data.get('density_time_i8'))
             closest_data.update({
-                'ctd_time': pd.Timestamp(density_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-6],
-                'ctd_T': density_T,
-                'ctd_S': density_S,
-                'ctd_SV': density_SV,
-                'ctd_rho': density_rho
+                'ctd_time': density['datetime'],
+                'ctd_T': density['Temperature'],
+                'ctd_S': density['Salinity'],
+                'ctd_SV': density['SoundVelocity'],
+                'ctd_rho': density['Density']
             })
         
-        if env_data.get('ds_tsticks'):
-            tstick_timestamp, tstick_temps = find_closest_tstick(
-                env_data['ds_tsticks'], timestamp
-            )
-            if tstick_temps is not None:
-                closest_data.update({
-                    'tstick_time': pd.Timestamp(tstick_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-6],
-                    'tstick_profile': ';'.join([f"{temp:.3f}" for temp in tstick_temps])
-                })
+        tsticks = find_closest_tsticks(env_data.get('ds_tsticks'), timestamps, env_data.get('tsticks_time_i8'))
+        if tsticks is not None:
+            closest_data.update({
+                'tstick_time': tsticks['datetime'],
+                'tstick_profile': np.array(
+                    [';'.join(profile) for profile in np.char.mod('%.3f', tsticks['T_deg']).tolist()], dtype=object
+                )
+            })
         
         return closest_data
     
-    def _create_info_file(self, test_file: Path, max_timestamp: datetime, closest_data: Dict):
-        """Create the info text file for a test."""
+    @staticmethod
+    def _format_timestamp(timestamp: Any) -> str:
+        """Format a timestamp for the info files ('N/A' if missing)."""
+        if timestamp is None or pd.isna(timestamp):
+            return 'N/A'
+        return pd.Timestamp(timestamp).strftime(_TIMESTAMP_FORMAT)
+    
+    def _build_summary(self, folder_name: str, test_files: List[Path], peak_times: np.ndarray,
+                       closest: Dict[str, np.ndarray], kept: np.ndarray) -> pd.DataFrame:
+        """Assemble the summary DataFrame of a folder from its columns in one step."""
+        n = len(test_files)
+        missing_text = np.full(n, 'N/A', dtype=object)
+        missing_time = np.full(n, np.datetime64('NaT'), dtype='datetime64[ns]')
+        missing_value = np.full(n, np.nan, dtype=np.float32)
+        columns = {
+            "measurement_file_[.txt]": np.array([test_file.name for test_file in test_files], dtype=object),
+            "Experiment_PeakTime": peak_times,
+            "ctd_time": closest.get('ctd_time', missing_time),
+            "ctd_T": closest.get('ctd_T', missing_value),
+            "ctd_S": closest.get('ctd_S', missing_value),
+            "ctd_SV": closest.get('ctd_SV', missing_value),
+            "ctd_rho": closest.get('ctd_rho', missing_value.astype(np.float64)),
+            "tstick_time": closest.get('tstick_time', missing_time),
+            "tstick_profile": closest.get('tstick_profile', missing_text),
+            "caution": np.full(n, "", dtype=object),
+            "experiment_folder": np.full(n, folder_name, dtype=object),
+        }
+        return pd.DataFrame({name: values[kept] for name, values in columns.items()})
+    
+    def _create_info_file(self, test_file: Path, max_timestamp: datetime, closest_data: Dict) -> str:
+        """
+        Create the info text file for a test.
+        
+        Returns:
+            Header of the info file (up to the CTD timestamp), as shown in the plots
+        """
         output_file = test_file.parent / f"info_{test_file.name}"
         
         antauzeit_hours = (max_timestamp - self.reference_time).total_seconds() / 3600
         
-        content = f"""File: {test_file}
-Max Force Timestamp: {pd.Timestamp(max_timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-6]}
+        header = f"""File: {test_file}
+Max Force Timestamp: {self._format_timestamp(max_timestamp)}
 Antauzeit (hours since {self.reference_time.strftime("%Y-%m-%d %H:%M:%S")}): {antauzeit_hours:.2f} h
 
 CTD Data:
-- Timestamp: {closest_data.get('ctd_time', 'N/A')}
-- Temperature: {closest_data.get('ctd_T', 'N/A'):.4f} °C
+- Timestamp: {self._format_timestamp(closest_data.get('ctd_time'))}
+"""
+        details = f"""- Temperature: {closest_data.get('ctd_T', 'N/A'):.4f} °C
 - Salinity: {closest_data.get('ctd_S', 'N/A'):.4f} [psu]
 - Sound Speed: {closest_data.get('ctd_SV', 'N/A'):.3f} m/s
 - Density: {closest_data.get('ctd_rho', 'N/A'):.3f} kg/m³
 
 T-Stick Data:
-- Timestamp: {closest_data.get('tstick_time', 'N/A')}
+- Timestamp: {self._format_timestamp(closest_data.get('tstick_time'))}
 - Profile: {closest_data.get('tstick_profile', 'N/A')}
 """
         
         with open(output_file, 'w') as f:
-            f.write(content)
+            f.write(header + details)
         
         logger.info(f"Info file saved: {output_file}")
+        return header
     
     def _save_folder_summary(self, folder_path: Path, df: pd.DataFrame):
         """Save summary CSV for individual folder."""
         csv_path = folder_path / "experiment_summary.csv"
-        df.to_csv(csv_path, index=False, sep=';', decimal=',')
+        df.to_csv(csv_path, index=False, sep=';', decimal=',', date_format=_TIMESTAMP_FORMAT)
         logger.info(f"Folder summary saved: {csv_path}")
     
-    def run_analysis(self, skip_existing: bool = True) -> None:
+    def run_analysis(self, skip_existing: bool = True, max_workers: Optional[int] = 1) -> None:
         """
         Run the complete analysis pipeline.
         
         Args:
             skip_existing: If True, skip folders already processed
+            max_workers: Number of worker processes for the folders (default 1: all folders
+                in this process; None: number of CPUs). With more than one worker the calling
+                script needs an `if __name__ == "__main__":` guard (spawn start method on macOS/Windows)
         """
         logger.info("Starting ice experiment analysis")
         
@@ -328,44 +535,86 @@ T-Stick Data:
                 return
             
             logger.info(f"Processing {len(folders_to_process)} new folders: {folders_to_process}")
-            
-            # Load existing data
-            existing_df = pd.DataFrame()
-            if self.master_csv_path.exists():
-                existing_df = pd.read_csv(self.master_csv_path, sep=';', decimal=',')
         else:
             folders_to_process = experiment_folders
-            existing_df = pd.DataFrame()
             logger.info(f"Processing all {len(folders_to_process)} folders")
         
-        # Process folders
-        all_results = [existing_df] if not existing_df.empty else []
+        # Folders are independent of each other and are processed in parallel
+        folder_names = sorted(folders_to_process)
+        if max_workers == 1 or len(folder_names) <= 1:
+            results = [
+                self.process_single_experiment(self.base_experiment_path / folder_name)
+                for folder_name in folder_names
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_folder_worker,
+                                     initargs=(self.base_experiment_path, self.reference_time)) as executor:
+                results = []
+                for result_df, info_texts in executor.map(_process_folder_worker, folder_names):
+                    results.append(result_df)
+                    self.info_text_by_file.update(info_texts)
         
-        for folder_name in sorted(folders_to_process):
-            folder_path = self.base_experiment_path / folder_name
-            result_df = self.process_single_experiment(folder_path)
-            
+        new_results = []
+        for folder_name, result_df in zip(folder_names, results):
             if result_df is not None:
-                all_results.append(result_df)
+                new_results.append((folder_name, result_df))
                 logger.info(f"✅ Successfully processed {folder_name}")
             else:
                 logger.warning(f"⚠️ Skipped {folder_name}")
         
-        # Combine and save results
-        if all_results:
-            final_df = pd.concat(all_results, ignore_index=True)
-            final_df.to_csv(self.master_csv_path, index=False, sep=';', decimal=',')
+        # Save results: new folders are appended as parts, existing parts are not rewritten
+        if not skip_existing:
+            if new_results:
+                for part_path in self._master_parts():
+                    part_path.unlink()
+        elif not self._master_parts():
+            # Legacy single-file store (already loaded by get_processed_folders) becomes the first part
+            legacy_df = self._load_master()
+            if not legacy_df.empty:
+                self._append_master_part("migrated", legacy_df)
+        
+        if new_results or (skip_existing and self._master_parts()):
+            for folder_name, result_df in new_results:
+                self._append_master_part(folder_name, result_df)
+            self._existing_df = None  # Re-read from the parts on next use
             
-            logger.info(f"🎉 Master summary saved: {self.master_csv_path}")
-            logger.info(f"📊 Total measurements: {len(final_df)}")
+            # Statistics from the experiment_folder column only, not the full master summary
+            folder_column = self._load_folder_column()
+            logger.info(f"🎉 Master summary saved: {self.master_store_path}")
+            logger.info(f"📊 Total measurements: {len(folder_column)}")
             
             # Show folder statistics
-            folder_counts = final_df['experiment_folder'].value_counts()
+            folder_counts = (
+                folder_column.astype(str).value_counts(sort=False)
+                .sort_values(ascending=False, kind='stable')
+            )
             logger.info("Folder statistics:")
             for folder, count in folder_counts.items():
                 logger.info(f"  - {folder}: {count} measurements")
 
 
+_worker_analyzer: Optional[IceExperimentAnalyzer] = None  # One analyzer per worker process
+
+
+def _init_folder_worker(base_experiment_path: Path, reference_time: datetime) -> None:
+    """Create the analyzer of a worker process once, so its environmental cache outlives a single folder."""
+    global _worker_analyzer
+    _worker_analyzer = IceExperimentAnalyzer(base_experiment_path, reference_time)
+
+
+def _process_folder_worker(folder_name: str) -> Tuple[Optional[pd.DataFrame], Dict[str, str]]:
+    """
+    Process one experiment folder in a worker process (module level, so it can be pickled).
+    
+    Returns:
+        The folder summary (or None) and the info file headers of the folder,
+        to be merged into the parent's info_text_by_file
+    """
+    _worker_analyzer.info_text_by_file.clear()  # Only this folder's headers go back to the parent
+    result_df = _worker_analyzer.process_single_experiment(_worker_analyzer.base_experiment_path / folder_name)
+    return result_df, dict(_worker_analyzer.info_text_by_file)
+
+
 def main():
     """Main entry point for the analysis."""
     # Configuration - move to config file later
@@ -1,4 +1,6 @@
 import os
+import glob
+from functools import lru_cache
 
 def load_custom_comments(comment_file_path):
     """Lädt die Datei mit benutzerdefinierten Kommentaren im erweiterten Format."""
@@ -6,25 +8,43 @@ def load_custom_comments(comment_file_path):
         print(f"⚠️ Kommentar-Datei nicht gefunden: {comment_file_path}")
         return {}
 
-    with open(comment_file_path, "r") as f:
-        lines = [line.strip() for line in f.readlines()]
-
     comments = {}
     current_file = None
     buffer = []
 
-    for line in lines:
-        if line.startswith("#"):
-            if current_file and buffer:
-                comments[current_file] = "\n".join(buffer)
-            current_file = line[1:].strip()
-            buffer = []
-        elif line:
-            buffer.append(line)
+    # Datei zeilenweise streamen statt sie komplett in eine Liste zu lesen
+    with open(comment_file_path, "r") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if line.startswith("#"):
+                if current_file and buffer:
+                    comments[current_file] = "\n".join(buffer)
+                current_file = line[1:].strip()
+                buffer.clear()
+            elif line:
+                buffer.append(line)
 
     if current_file and buffer:
         comments[current_file] = "\n".join(buffer)
 
     return comments
 
-    pass
+
+@lru_cache(maxsize=128)
+def _sorted_glob(pattern, directory_mtime_ns):
+    return tuple(sorted(glob.glob(pattern)))
+
+
+def cached_glob(pattern):
+    """sorted(glob.glob(pattern)), zwischengespeichert solange sich das Verzeichnis nicht ändert."""
+    directory = os.path.dirname(pattern) or '.'
+    if glob.has_magic(directory) or not os.path.isdir(directory):
+        return sorted(glob.glob(pattern))
+    return list(_sorted_glob(pattern, os.stat(directory).st_mtime_ns))
+
+
+def resolve_files(files):
+    """Dateien für die Reader: Glob-Muster (str) oder eine bereits ermittelte Liste von Pfaden."""
+    if isinstance(files, (str, os.PathLike)):
+        return cached_glob(str(files))
+    return [str(path) for path in files]
@@ -0,0 +1,74 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba ist optional, ohne wird die numpy-Variante verwendet
+    njit = None
+
+__all__ = ['moving_average', 'analyze_trace']
+
+
+def moving_average(values, window_size):
+    """
+    Gleitender Mittelwert über window_size Punkte (kumulative Summe statt Schleife).
+
+    Wie np.convolve(..., mode='valid') werden nur vollständige Fenster berechnet;
+    Eintrag i ist der Mittelwert von values[i:i + window_size].
+    """
+    csum = np.empty(len(values) + 1, dtype=np.float64)
+    csum[0] = 0.0
+    np.cumsum(values, dtype=np.float64, out=csum[1:])
+    return (csum[window_size:] - csum[:-window_size]) / window_size
+
+
+def _analyze_trace_numpy(force, window_size):
+    force_avg = moving_average(force, window_size)
+    max_idx = int(force.argmax())
+    max_idx_avg = int(force_avg.argmax())
+    return max_idx, force[max_idx], max_idx_avg, force_avg[max_idx_avg], force_avg
+
+
+def _analyze_trace_loop(force, window_size):
+    # Ein Durchlauf: laufende Fenstersumme, Mittelwert und beide Maxima zugleich
+    n = force.shape[0]
+    force_avg = np.empty(n - window_size + 1, dtype=np.float64)
+    max_idx = 0
+    max_idx_avg = 0
+    window_sum = 0.0
+    for i in range(n):
+        if force[i] > force[max_idx]:
+            max_idx = i
+        window_sum += force[i]
+        if i >= window_size:
+            window_sum -= force[i - window_size]
+        if i >= window_size - 1:
+            j = i - window_size + 1
+            force_avg[j] = window_sum / window_size
+            if force_avg[j] > force_avg[max_idx_avg]:
+                max_idx_avg = j
+    return max_idx, force[max_idx], max_idx_avg, force_avg[max_idx_avg], force_avg
+
+
+_analyze_trace_jit = njit(cache=True)(_analyze_trace_loop) if njit is not None else None
+
+
+def analyze_trace(force, window_size):
+    """
+    Maximum der Rohdaten und des gleitenden Mittelwerts einer Kraftkurve.
+
+    Mit numba läuft alles in einer kompilierten Schleife, sonst mit numpy
+    (kumulative Summe und je ein argmax).
+
+    Args:
+        force (np.ndarray): Kraftwerte
+        window_size (int): Fensterbreite des gleitenden Mittelwerts
+
+    Returns:
+        tuple: (max_idx, max_force, max_idx_avg, max_force_avg, force_avg)
+    """
+    force = np.asarray(force)
+    if not 0 < window_size <= len(force):
+        raise ValueError(f"window_size must be between 1 and {len(force)}, got {window_size}")
+    if _analyze_trace_jit is not None:
+        return _analyze_trace_jit(force, window_size)
+    return _analyze_trace_numpy(force, window_size)
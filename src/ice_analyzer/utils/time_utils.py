@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def _nearest_index_scalar(times_i8, target_i8):
+    """Skalarer Pfad von nearest_index für Einzelabfragen: nur Ganzzahl-Vergleiche, keine Hilfsarrays."""
+    right = int(np.searchsorted(times_i8, target_i8))
+    if right == 0:
+        return 0
+    if right == len(times_i8) or target_i8 - times_i8[right - 1] <= times_i8[right] - target_i8:
+        # Linker Nachbar; bei doppelten Zeitstempeln auf den ersten Eintrag zurückspringen
+        return int(np.searchsorted(times_i8, times_i8[right - 1]))
+    return right
+
+
+def time_index(times):
+    """
+    Int64-Sicht (Nanosekunden) einer datetime64-Zeitachse für wiederholte nearest_index-Aufrufe.
+
+    Einmal pro Zeitachse berechnen und statt der datetime64-Werte an nearest_index übergeben.
+    """
+    return np.asarray(times).astype('datetime64[ns]', copy=False).view('i8')
+
+
+def nearest_index(times, targets):
+    """
+    Findet per binärer Suche den Index des nächstgelegenen Zeitstempels.
+
+    Ersetzt np.argmin(np.abs(times - target)): kein temporäres Differenz-Array,
+    O(log N) statt O(N) pro Zielzeitpunkt. Bei gleichem Abstand bzw. doppelten
+    Zeitstempeln wird – wie bei np.argmin – der erste Eintrag gewählt.
+
+    Args:
+        times (np.ndarray): Aufsteigend sortierte datetime64-Werte oder deren
+            Int64-Sicht aus time_index
+        targets (datetime-like or array-like): Ein oder mehrere Zielzeitpunkte
+
+    Returns:
+        int or np.ndarray: Index (bzw. Indizes) in `times`
+    """
+    times = np.asarray(times)
+    if times.dtype.kind == 'M':
+        times_i8 = times.view('i8')
+        targets_i8 = np.asarray(targets, dtype=times.dtype).view('i8')
+    else:
+        # Bereits umgerechnete Zeitachse aus time_index (Nanosekunden)
+        times_i8 = times
+        targets_i8 = np.asarray(targets, dtype='datetime64[ns]').view('i8')
+
+    if len(times_i8) == 0:
+        raise ValueError("Cannot find closest timestamp in an empty time series.")
+    if targets_i8.ndim == 0:
+        return _nearest_index_scalar(times_i8, int(targets_i8))
+    if len(times_i8) == 1:
+        idx = np.zeros(targets_i8.shape, dtype=np.intp)
+    else:
+        right = np.clip(np.searchsorted(times_i8, targets_i8), 1, len(times_i8) - 1)
+        left = right - 1
+        use_left = (targets_i8 - times_i8[left]) <= (times_i8[right] - targets_i8)
+        idx = np.where(use_left, left, right)
+        # Bei doppelten Zeitstempeln auf den ersten Eintrag zurückspringen
+        idx = np.searchsorted(times_i8, times_i8[idx])
+
+    return idx
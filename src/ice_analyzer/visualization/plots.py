@@ -1,54 +1,98 @@
 import matplotlib.pyplot as plt
-import numpy as np
+from matplotlib.figure import Figure
 import os
-
-def visualize_test_files(files, window_size, custom_comments):
-    """Erstellt Plots für alle Testdateien mit Metadaten und Zusatzinformationen."""
-    # Plots vorbereiten
-    fig, axes = plt.subplots(len(files), 1, figsize=(14, 5 * len(files)), sharex=True)
-
-    # Wenn nur eine Datei, stelle sicher, dass axes iterierbar ist
-    if len(files) == 1:
-        axes = [axes]
+from pathlib import Path
+
+from ..data_processing.dewesoft_reader import read_data
+from ..utils.kernels import analyze_trace
+
+FILES_PER_PAGE = 6  # Testdateien pro Abbildung (begrenzt die Größe des Rasterbilds)
+
+
+def visualize_test_files(files, window_size, custom_comments, info_text_by_file=None,
+                         show=False, files_per_page=FILES_PER_PAGE, dpi=150):
+    """
+    Erstellt Plots für alle Testdateien mit Metadaten und Zusatzinformationen.
+
+    Bei mehr als files_per_page Dateien wird auf mehrere Abbildungen verteilt
+    (..._page1.png, ..._page2.png, ...).
+
+    Args:
+        files (list of str): Testdateien
+        window_size (int): Fensterbreite des gleitenden Mittelwerts
+        custom_comments (dict): Kommentare je Dateiname
+        info_text_by_file (dict, optional): Kopf der Info-Datei je absolutem Dateipfad, z.B.
+            IceExperimentAnalyzer.info_text_by_file. Fehlt ein Eintrag, wird info_<Datei> gelesen.
+        show (bool): Abbildungen zusätzlich interaktiv anzeigen (Standard: nur speichern)
+        files_per_page (int): Maximale Anzahl Testdateien pro Abbildung
+        dpi (int): Auflösung der gespeicherten PNGs
+
+    Returns:
+        list of str: Pfade der gespeicherten Abbildungen
+    """
+    info_text_by_file = info_text_by_file or {}
+    pages = [files[start:start + files_per_page] for start in range(0, len(files), files_per_page)]
+
+    output_paths = []
+    for page_number, page_files in enumerate(pages, start=1):
+        offset = (page_number - 1) * files_per_page
+        suffix = f"_page{page_number}" if len(pages) > 1 else ""
+        output_paths.append(
+            _plot_page(files, page_files, offset, suffix, window_size, custom_comments,
+                       info_text_by_file, show, dpi)
+        )
+
+    if show:
+        plt.show()
+    return output_paths
+
+
+def _plot_page(files, page_files, offset, suffix, window_size, custom_comments, info_text_by_file, show, dpi):
+    """Plottet die Dateien einer Seite in eine Abbildung und speichert sie."""
+    # Plots vorbereiten; ohne Anzeige reicht eine Figure mit Agg-Canvas (kein GUI-Backend)
+    figsize = (14, 5 * len(page_files))
+    fig = plt.figure(figsize=figsize) if show else Figure(figsize=figsize)
+    axes = fig.subplots(len(page_files), 1, sharex=True, squeeze=False)[:, 0]
 
     # Jede Datei einlesen und plotten
-    for idx, file in enumerate(files):
-        meta, time, force = read_data(file)
-        meta, corrected_time = correct_start_time(meta)
-
-        # Mittelwerte berechnen
-        force_avg = moving_average(force, window_size)
-        time_avg = time[:len(force_avg)]
+    for idx, file in enumerate(page_files, start=offset):
+        meta, time, force, corrected_time = read_data(file)  # Startzeit ist bereits korrigiert
 
-        # Maxima berechnen
-        max_idx = np.argmax(force)
-        max_idx_avg = np.argmax(force_avg)
+        # Mittelwerte und Maxima berechnen (jeder Mittelwert gehört zum letzten Punkt seines Fensters)
+        max_idx, max_force, max_idx_avg, max_force_avg, force_avg = analyze_trace(force, window_size)
+        time_avg = time[window_size - 1:]
 
         # Plot erstellen
-        ax = axes[idx]
+        ax = axes[idx - offset]
         ax.plot(time, force, label="Rohdaten (F)", color="b", alpha=0.5)
         ax.plot(time_avg, force_avg, label=f"{window_size}-Punkt Mittelwert", color="g")
-        ax.scatter(time[max_idx], force[max_idx], color='r', marker='+', s=100, label=f"Max: {force[max_idx]:.3f} N")
-        ax.scatter(time_avg[max_idx_avg], force_avg[max_idx_avg], color='g', marker='+', s=100, label=f"Max Ø: {force_avg[max_idx_avg]:.3f} N")
+        ax.scatter(time[max_idx], max_force, color='r', marker='+', s=100, label=f"Max: {max_force:.3f} N")
+        ax.scatter(time_avg[max_idx_avg], max_force_avg, color='g', marker='+', s=100, label=f"Max Ø: {max_force_avg:.3f} N")
 
         # Metadata Box
         ax.text(0.5, 0.95, "\n".join(meta),
                 fontsize=10, bbox=dict(facecolor='white', alpha=0.7),
                 ha='left', va='top', transform=ax.transAxes, multialignment='left')
 
-        # Suche passende Info-Datei
-        info_file = os.path.join(os.path.dirname(file), "info_" + os.path.basename(file))
-        if os.path.exists(info_file):
-            with open(info_file, "r") as f:
-                lines = f.readlines()
-                info_lines = lines[:-8] if len(lines) > 8 else lines
+        # Info-Text aus dem Speicher, sonst aus der passenden Info-Datei
+        filename_only = os.path.basename(file)
+        info_file = os.path.join(os.path.dirname(file), "info_" + filename_only)
+        info_text = info_text_by_file.get(os.path.abspath(file))
+        if info_text is not None:
+            info_lines = info_text.splitlines(keepends=True)
+        elif os.path.exists(info_file):
+            lines = Path(info_file).read_text().splitlines(keepends=True)
+            info_lines = lines[:-8] if len(lines) > 8 else lines
+        else:
+            info_lines = None
 
-                # Nur Ordner + Dateiname anzeigen
-                short_path = os.path.join(os.path.basename(os.path.dirname(file)), os.path.basename(file))
-                if info_lines:
-                    info_lines[0] = f"Test File: {short_path}\n"
+        if info_lines is not None:
+            # Nur Ordner + Dateiname anzeigen
+            short_path = os.path.join(os.path.basename(os.path.dirname(file)), filename_only)
+            if info_lines:
+                info_lines[0] = f"Test File: {short_path}\n"
 
-                info_text = "".join(info_lines)
+            info_text = "".join(info_lines)
         else:
             info_text = "Keine Info-Datei gefunden."
 
@@ -58,7 +102,6 @@ def visualize_test_files(files, window_size, custom_comments):
                 ha='left', va='bottom', transform=ax.transAxes, multialignment='left')
 
         # Benutzerdefinierter Kommentar (oben rechts)
-        filename_only = os.path.basename(file)
         user_comment = custom_comments.get(filename_only, "Kein Kommentar vorhanden.")
         ax.text(0.98, 0.75, user_comment,
                 fontsize=10, bbox=dict(facecolor='white', alpha=0.7),
@@ -71,8 +114,8 @@ def visualize_test_files(files, window_size, custom_comments):
         ax.grid()
 
     # Finalisieren
-    plt.xlabel("Zeit (s)")
-    plt.tight_layout()
+    axes[-1].set_xlabel("Zeit (s)")
+    fig.tight_layout()
 
     # Extrahiere Ordnername und Datum aus dem ersten Dateinamen
     parent_folder = os.path.basename(os.path.normpath(os.path.dirname(files[0])))
@@ -88,10 +131,10 @@ def visualize_test_files(files, window_size, custom_comments):
     else:
         date_str = "UnbekanntesDatum"
 
-    # Speichern des Plots in hoher Auflösung
-    output_filename = f"Biegefestigkeit_{parent_folder}_{date_str}.png"
+    # Speichern des Plots
+    output_filename = f"Biegefestigkeit_{parent_folder}_{date_str}{suffix}.png"
     output_path = os.path.join(os.path.dirname(files[0]), output_filename)
-    plt.savefig(output_path, dpi=300)  # Hohe Auflösung
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
     print(f"✅ Plot gespeichert als: {output_path}")
-    plt.show()
-    pass
+    # Eine Figure ohne pyplot wird nicht global registriert und mit der Funktion freigegeben
+    return output_path